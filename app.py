@@ -1,9 +1,29 @@
-from flask import Flask, render_template, request, jsonify
+import os
+import warnings
+
+# Suppress FutureWarnings
+warnings.filterwarnings("ignore", category=FutureWarning)
+
+# Disable Flask's built-in dotenv loading
+os.environ["FLASK_SKIP_DOTENV"] = "1"
+
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import functools
 import vosk, sounddevice as sd, queue, json
 import argostranslate.translate
-import os
+import io
+import re
+import statistics
+import subprocess
 import tempfile
 import sys
+import threading
+import time
+import wave
 import logging
 
 # Configure logging
@@ -14,21 +34,58 @@ logger = logging.getLogger(__name__)
 # Import pyttsx3 for TTS (backup only)
 import pyttsx3
 
-# Pygame for audio playback
-import pygame
-
-# Suppress FutureWarnings
-import warnings
-warnings.filterwarnings("ignore", category=FutureWarning)
-
-# Disable Flask's built-in dotenv loading
-os.environ["FLASK_SKIP_DOTENV"] = "1"
-
 app = Flask(__name__)
 
 q = queue.Queue()
 vosk.SetLogLevel(-1)
 
+# Microphone capture: 100 ms blocks at 16 kHz so end of speech is noticed quickly
+SAMPLE_RATE = 16000
+BLOCKSIZE = 1600
+
+# Reusable capture buffers so the audio callback does not allocate per block
+BUF_POOL_SIZE = 8
+BUF_POOL = queue.Queue()
+for _ in range(BUF_POOL_SIZE):
+    BUF_POOL.put(bytearray(BLOCKSIZE * 2))  # int16 mono
+
+# Sentence-level chunking between recognition and translation/speech. Vosk
+# small models emit no punctuation, so finals are also split where the
+# speaker paused, using Vosk's word timings
+SENTENCE_END = re.compile(r'[.?!]\s*$')
+MAX_CHUNK_WORDS = 40
+CHUNK_PAUSE_SECONDS = 0.3
+
+# Targets written without spaces between sentences
+NO_SPACE_LANGUAGES = {"ja", "zh"}
+
+# A partial transcript unchanged for this many audio blocks is translated
+# speculatively so the final result usually finds it already done
+PARTIAL_STABLE_BLOCKS = 3
+# Speculative translations run here rather than on the event loop's default
+# executor, so asyncio.run() never waits on ones that end up unused
+SPECULATIVE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+# SAPI stream format for in-memory synthesis: 22kHz 16-bit mono (SAFT22kHz16BitMono)
+SAPI_FORMAT_TYPE = 22
+SAPI_SAMPLE_RATE = 22050
+
+# Synthesized PCM waiting to be written to the output device
+PLAYBACK_QUEUE = queue.Queue()
+_playback_thread = None
+_playback_thread_lock = threading.Lock()
+
+# Translations waiting to be spoken by the background TTS thread
+# Only that thread touches the SAPI and pyttsx3 engines, so synthesis is
+# already serialized across requests
+TTS_QUEUE = queue.Queue()
+_tts_thread = None
+_tts_thread_lock = threading.Lock()
+
+# Rolling per-request latencies in ms for each pipeline stage, served by /metrics
+LATENCY_STAGES = ("stt_ms", "mt_ms", "tts_first_chunk_ms", "tts_total_ms")
+LATENCIES = {stage: collections.deque(maxlen=1000) for stage in LATENCY_STAGES}
+
 # Language configs
 LANGUAGES = {
     "English": "en",
@@ -48,10 +105,46 @@ MODEL_PATHS = {
     "zh": "models/vosk-model-small-cn-0.22",
 }
 
+# Preload speech recognition models once; vosk.Model is safe to share
+# between recognizers, so only the KaldiRecognizer is created per request
+MODELS = {}
+for code, path in MODEL_PATHS.items():
+    if os.path.exists(path):
+        try:
+            MODELS[code] = vosk.Model(path)
+            logger.info(f"Loaded speech model for {code} from {path}")
+        except Exception as e:
+            logger.error(f"Failed to load speech model for {code}: {str(e)}")
+
 # Set eSpeak path directly - hardcoded with the known correct path
 ESPEAK_PATH = r"C:\Program Files (x86)\eSpeak\command_line\espeak.exe"
+ESPEAK_AVAILABLE = os.path.exists(ESPEAK_PATH)
 logger.info(f"Using eSpeak path: {ESPEAK_PATH}")
 
+# Shared pyttsx3 engine for the last-resort TTS fallback, with a
+# language -> voice id map. Both are set up once on the TTS thread by
+# _init_pyttsx3(), since pyttsx3 engines can't be used from another thread
+PYTTSX3_ENGINE = None
+PYTTSX3_DEFAULT_VOICE = None
+VOICE_MAP = {}
+# Set by the TTS thread once the pyttsx3 engine and voice scan have finished
+PYTTSX3_READY = threading.Event()
+
+# Translation objects per (source, target) pair, filled by initialize_translations
+TRANSLATION_TABLE = {}
+# (source -> en, en -> target) translation objects for pivoting via English
+EN_PIVOT = {}
+# One lock per installed package translation, keyed by id(); Argos loads
+# models lazily without locking and its CTranslate2 translator serves one call
+# at a time. Composite (chained) translations share these package objects.
+TRANSLATION_LOCKS = {}
+
+def _package_translations(translation):
+    """Returns the package translations a (possibly composite) translation runs"""
+    if isinstance(translation, argostranslate.translate.CompositeTranslation):
+        return _package_translations(translation.t1) + _package_translations(translation.t2)
+    return [translation]
+
 # Initialize translation modules
 def initialize_translations():
     """Ensures all required language pairs are installed and ready for offline use"""
@@ -84,17 +177,31 @@ def initialize_translations():
                         missing_pairs.append(f"{pair_name} (missing: {', '.join(missing_langs)})")
                         continue
                     
-                    # Test translation
+                    # Look up the installed translation; Argos lists installed
+                    # pairs, so no test decode is needed
                     try:
                         translation = lang_dict[source_code].get_translation(lang_dict[target_code])
-                        test_text = "hello" if source_code == "en" else "test"
-                        test_result = translation.translate(test_text)
+                        if translation is None:
+                            raise KeyError(f"no installed package for {pair_name}")
+                        TRANSLATION_TABLE[(source_code, target_code)] = translation
+                        for model in _package_translations(translation):
+                            TRANSLATION_LOCKS.setdefault(id(model), threading.Lock())
                         available_pairs.append(pair_name)
                         logger.info(f"Translation pair available: {pair_name}")
                     except Exception as e:
                         missing_pairs.append(f"{pair_name} (error: {str(e)})")
                         logger.warning(f"Translation pair failed: {pair_name} - {str(e)}")
         
+        # Precompute two-step routes via English for non-English pairs
+        for source_code in LANGUAGES.values():
+            for target_code in LANGUAGES.values():
+                if "en" in (source_code, target_code) or source_code == target_code:
+                    continue
+                to_en = TRANSLATION_TABLE.get((source_code, "en"))
+                from_en = TRANSLATION_TABLE.get(("en", target_code))
+                if to_en is not None and from_en is not None:
+                    EN_PIVOT[(source_code, target_code)] = (to_en, from_en)
+        
         # Log summary
         logger.info(f"Available translation pairs: {len(available_pairs)}/{len(available_pairs) + len(missing_pairs)}")
         logger.info(f"Available pairs: {', '.join(available_pairs)}")
@@ -111,29 +218,168 @@ def initialize_translations():
 
 lang_dict = initialize_translations()
 
+def warm_translations():
+    """Runs one tiny translation per pair so the first real request hits a loaded model"""
+    for (source_code, target_code), translation in list(TRANSLATION_TABLE.items()):
+        try:
+            _run_model(translation, "a")
+        except Exception as e:
+            logger.warning(f"Warm-up failed for {source_code}-{target_code}: {str(e)}")
+    logger.info(f"Warmed {len(TRANSLATION_TABLE)} translation models")
+
+# Load the CTranslate2 models in the background instead of on first use
+threading.Thread(target=warm_translations, daemon=True).start()
+
 def audio_callback(indata, frames, time, status):
     """Callback function for audio stream processing"""
     if status:
         logger.warning(f"Audio callback status: {status}")
-    q.put(bytes(indata))
+    # Copy straight into a pooled buffer; a slice assignment would first
+    # materialize indata as a temporary bytes object
+    try:
+        buf = BUF_POOL.get_nowait()
+    except queue.Empty:
+        buf = None
+    if buf is not None and len(buf) == len(indata):
+        memoryview(buf)[:] = indata
+    else:
+        if buf is not None:
+            BUF_POOL.put(buf)
+        buf = bytearray(indata)
+    q.put(buf)
 
 def recognize_speech(recognizer):
-    """Records and recognizes speech using the Vosk model"""
+    """
+    Records and recognizes speech using the Vosk model. Yields a
+    {"partial": text} frame for every audio block still in progress, then a
+    single {"final": text, "segments": [...]} frame once Vosk finalizes the
+    utterance, with the text split into pause-delimited phrases. The
+    microphone is closed before the final frame is yielded. Call
+    prepare_capture() first.
+    """
+    # Word timings let the final result be split on pauses
+    recognizer.SetWords(True)
+    
     with sd.RawInputStream(
-        samplerate=16000,
-        blocksize=8000,
+        samplerate=SAMPLE_RATE,
+        blocksize=BLOCKSIZE,
         dtype="int16",
         channels=1,
+        latency="low",
         callback=audio_callback,
     ):
         logger.info("Listening...")
         while True:
-            data = q.get()
+            # Feed any backlog to Vosk in one call rather than block by block
+            chunks = [q.get()]
+            while not q.empty():
+                chunks.append(q.get_nowait())
+            data = b"".join(chunks)
+            
+            _recycle_buffers(chunks)
             if recognizer.AcceptWaveform(data):
                 result = json.loads(recognizer.Result())
-                recognized_text = result.get("text", "")
-                logger.info(f"Recognized: '{recognized_text}'")
-                return recognized_text
+                break
+            result = json.loads(recognizer.PartialResult())
+            yield {"partial": result.get("partial", "")}
+    
+    recognized_text = result.get("text", "")
+    logger.info(f"Recognized: '{recognized_text}'")
+    segments = split_on_pauses(result.get("result", []))
+    if not segments and recognized_text:
+        segments = [recognized_text]
+    yield {"final": recognized_text, "segments": segments}
+
+def prepare_capture():
+    """
+    Waits out any speech still playing and drops audio left from an earlier
+    session, so recognition doesn't hear our own output
+    """
+    wait_for_speech()
+    stale = []
+    while not q.empty():
+        stale.append(q.get_nowait())
+    _recycle_buffers(stale)
+
+def split_on_pauses(words):
+    """Splits Vosk word timings into phrases wherever the speaker paused"""
+    phrases = []
+    current = []
+    last_end = None
+    for word in words:
+        if current and word["start"] - last_end >= CHUNK_PAUSE_SECONDS:
+            phrases.append(" ".join(current))
+            current = []
+        current.append(word["word"])
+        last_end = word["end"]
+    if current:
+        phrases.append(" ".join(current))
+    return phrases
+
+def _recycle_buffers(chunks):
+    """Hands capture buffers back to the audio callback's pool"""
+    for chunk in chunks:
+        # Odd-sized blocks from the fallback path are left to the GC
+        if len(chunk) == BLOCKSIZE * 2 and BUF_POOL.qsize() < BUF_POOL_SIZE:
+            BUF_POOL.put(chunk)
+
+def join_segments(segments, lang):
+    """Joins translated segments, without spaces for languages that don't use them"""
+    separator = "" if lang in NO_SPACE_LANGUAGES else " "
+    return separator.join(segments)
+
+def sentence_chunks(text_stream):
+    """
+    Regroups recognized segments into sentence-sized chunks so translation and
+    speech can start on the first sentence instead of the whole utterance
+    """
+    for text in text_stream:
+        buf = []
+        for word in text.split():
+            buf.append(word)
+            if SENTENCE_END.search(word) or len(buf) >= MAX_CHUNK_WORDS:
+                yield " ".join(buf)
+                buf = []
+        if buf:
+            yield " ".join(buf)
+
+def _run_model(translation, text):
+    """Runs one Argos translation, serialized per underlying model"""
+    # Take the locks in a fixed order so two composites sharing models can't deadlock
+    locks = sorted({id(model): TRANSLATION_LOCKS[id(model)]
+                    for model in _package_translations(translation)}.items())
+    with contextlib.ExitStack() as stack:
+        for _, lock in locks:
+            stack.enter_context(lock)
+        return translation.translate(text)
+
+@functools.lru_cache(maxsize=4096)
+def _do_translate(source, target, text):
+    """
+    Runs one translation from the precomputed tables, memoized on
+    (source, target, text) so repeats skip the model
+    """
+    pair = (source, target)
+    translation = TRANSLATION_TABLE.get(pair)
+    if translation is not None:
+        try:
+            return _run_model(translation, text)
+        except Exception as direct_error:
+            if pair not in EN_PIVOT:
+                raise
+            logger.warning(f"Direct translation failed: {str(direct_error)}")
+    
+    if pair not in EN_PIVOT:
+        raise KeyError(f"No translation model installed for {source}-{target}")
+    
+    # Two-step translation via English
+    logger.info(f"Attempting two-step translation via English")
+    to_en, from_en = EN_PIVOT[pair]
+    english_text = _run_model(to_en, text)
+    logger.info(f"First step: {source} -> en: '{english_text}'")
+    result = _run_model(from_en, english_text)
+    logger.info(f"Second step: en -> {target}: '{result}'")
+    return result
 
 def translate_text(text, source, target):
     """Translates text between languages using ArgosTranslate"""
@@ -152,43 +398,209 @@ def translate_text(text, source, target):
             logger.error(f"Target language {target} not installed")
             return f"[Translation failed: {target} language not installed]"
 
-        # Try direct translation first
-        try:
-            translation = lang_dict[source].get_translation(lang_dict[target])
-            result = translation.translate(text)
-            logger.info(f"Translated '{text}' from {source} to {target}: '{result}'")
-            return result
-        except Exception as direct_error:
-            logger.warning(f"Direct translation failed: {str(direct_error)}")
-            
-            # Try two-step translation via English if direct fails
-            if source != "en" and target != "en":
-                try:
-                    logger.info(f"Attempting two-step translation via English")
-                    # First translate to English
-                    en_translation = lang_dict[source].get_translation(lang_dict["en"])
-                    english_text = en_translation.translate(text)
-                    logger.info(f"First step: {source} -> en: '{english_text}'")
-                    
-                    # Then translate from English to target
-                    target_translation = lang_dict["en"].get_translation(lang_dict[target])
-                    result = target_translation.translate(english_text)
-                    logger.info(f"Second step: en -> {target}: '{result}'")
-                    return result
-                except Exception as two_step_error:
-                    logger.error(f"Two-step translation also failed: {str(two_step_error)}")
-            
-            # If all translation attempts fail
-            raise direct_error
+        # Argos splits sentences itself and decodes them as one batch
+        result = _do_translate(source, target, text)
+        logger.info(f"Translated '{text}' from {source} to {target}: '{result}'")
+        return result
             
     except Exception as e:
         logger.error(f"Translation error: {str(e)}")
         return f"[Translation Failed: {str(e)}]"
 
+def elapsed_ms(start):
+    """Milliseconds since a time.perf_counter() timestamp"""
+    return (time.perf_counter() - start) * 1000
+
+def record_timings(timings):
+    """Adds one request's stage latencies to the rolling window and logs them as JSON"""
+    line = {}
+    for stage in LATENCY_STAGES:
+        if stage in timings:
+            line[stage] = round(timings[stage], 1)
+            LATENCIES[stage].append(line[stage])
+    logger.info(f"Latency: {json.dumps(line)}")
+
+def _emit(events, **event):
+    """Publishes a pipeline event to a streaming client, if one is listening"""
+    if events is not None:
+        events.put(event)
+
+async def stt_worker(recognizer, text_q, transcript, source, target, speculative, timings, events=None):
+    """
+    Pipeline stage: recognizes speech off the event loop and feeds sentence
+    chunks downstream. Partials that stop changing are translated ahead of time
+    into speculative, keyed by chunk text.
+    """
+    loop = asyncio.get_running_loop()
+    # Earlier requests' playback isn't part of this request's STT time
+    await loop.run_in_executor(None, prepare_capture)
+    start = time.perf_counter()
+    frames = recognize_speech(recognizer)
+    last_partial = ""
+    stable_blocks = 0
+    try:
+        while True:
+            frame = await loop.run_in_executor(None, next, frames, None)
+            if frame is None:
+                break
+            
+            if "partial" in frame:
+                partial = frame["partial"]
+                if partial != last_partial:
+                    last_partial = partial
+                    stable_blocks = 0
+                    _emit(events, partial=partial)
+                    continue
+                stable_blocks += 1
+                if partial and stable_blocks == PARTIAL_STABLE_BLOCKS:
+                    for chunk in sentence_chunks([partial]):
+                        if chunk not in speculative:
+                            speculative[chunk] = loop.run_in_executor(
+                                SPECULATIVE_EXECUTOR, translate_text, chunk, source, target
+                            )
+                continue
+            
+            last_partial = ""
+            stable_blocks = 0
+            for chunk in sentence_chunks(frame["segments"]):
+                transcript.append(chunk)
+                _emit(events, recognized=chunk)
+                await text_q.put(chunk)
+
+        # Nothing was said; let the downstream stages report it as before
+        if not transcript:
+            await text_q.put("")
+    finally:
+        timings["stt_ms"] = elapsed_ms(start)
+        # Closing the generator also closes the microphone stream
+        frames.close()
+        await text_q.put(None)
+
+async def mt_worker(text_q, source, target, translations, speculative, timings, events=None):
+    """
+    Pipeline stage: translates each recognized segment as soon as it arrives
+    and hands it to the background TTS thread
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        text = await text_q.get()
+        if text is None:
+            break
+        start = time.perf_counter()
+        pending = speculative.pop(text, None)
+        if pending is not None:
+            translated = await pending
+        else:
+            translated = await loop.run_in_executor(None, translate_text, text, source, target)
+        timings["mt_ms"] = timings.get("mt_ms", 0.0) + elapsed_ms(start)
+        translations.append(translated)
+        _emit(events, translated=translated)
+        timings.setdefault("tts_start", time.perf_counter())
+        enqueue_speech(translated, target, timings)
+
+async def run_pipeline(recognizer, source, target, transcript, events=None):
+    """
+    Runs STT -> MT as concurrent stages connected by a queue, so each segment
+    is translated and queued for speech without waiting for the whole
+    utterance. Speech runs on the TTS thread, so this returns once the last
+    segment is translated. Recognized segments are appended to transcript;
+    translations are returned. If events is a queue, partial/recognized/
+    translated events are put on it.
+    """
+    text_q = asyncio.Queue(maxsize=4)
+    translations = []
+    speculative = {}
+    timings = {}
+
+    try:
+        await asyncio.gather(
+            stt_worker(recognizer, text_q, transcript, source, target, speculative, timings, events),
+            mt_worker(text_q, source, target, translations, speculative, timings, events),
+        )
+    finally:
+        # Drop speculative translations no final result claimed; ones already
+        # running still finish into the translation cache
+        for pending in speculative.values():
+            pending.cancel()
+        # Marks the end of this request's speech so TTS timings can be recorded
+        enqueue_speech(None, target, timings)
+    return translations
+
+def init_tts():
+    """Starts the background TTS thread, which owns the SAPI and pyttsx3 objects"""
+    global _tts_thread
+    with _tts_thread_lock:
+        if _tts_thread is None:
+            _tts_thread = threading.Thread(target=_tts_loop, daemon=True)
+            _tts_thread.start()
+
+def enqueue_speech(text, lang, timings=None):
+    """
+    Queues text to be spoken by the background TTS thread, starting it if
+    needed. A None text closes out the request that owns timings.
+    """
+    init_tts()
+    TTS_QUEUE.put((text, lang, timings))
+
+def wait_for_speech():
+    """Blocks until every queued translation has been synthesized and played"""
+    TTS_QUEUE.join()
+    wait_for_playback()
+
+def _init_pyttsx3():
+    """
+    Creates the pyttsx3 engine on the calling thread; init() creates a SAPI
+    COM object and the voice scan walks the registry, so do both once
+    """
+    global PYTTSX3_ENGINE, PYTTSX3_DEFAULT_VOICE, VOICE_MAP
+    # SAPI objects are apartment-bound; COM must be initialized on this thread
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pass
+    
+    try:
+        engine = pyttsx3.init()
+        engine.setProperty('rate', 120)  # Slower speech rate
+        engine.setProperty('volume', 1.0)  # Maximum volume
+        PYTTSX3_DEFAULT_VOICE = engine.getProperty('voice')
+        voices = engine.getProperty('voices')
+        VOICE_MAP = {
+            lang: next((voice.id for voice in voices if lang in voice.id.lower()), None)
+            for lang in LANGUAGES.values()
+        }
+        PYTTSX3_ENGINE = engine
+    except Exception as e:
+        logger.error(f"pyttsx3 initialization error: {str(e)}")
+    finally:
+        PYTTSX3_READY.set()
+
+def _tts_loop():
+    """Speaks queued translations one at a time, queueing audio for gapless playback"""
+    _init_pyttsx3()
+    while True:
+        text, lang, timings = TTS_QUEUE.get()
+        try:
+            if text is None:
+                if timings is not None:
+                    if "tts_start" in timings:
+                        timings["tts_total_ms"] = elapsed_ms(timings["tts_start"])
+                    record_timings(timings)
+                continue
+            speak_text(text, lang)
+            if timings is not None and "tts_first_chunk_ms" not in timings:
+                timings["tts_first_chunk_ms"] = elapsed_ms(timings["tts_start"])
+        except Exception as e:
+            logger.error(f"TTS worker error: {str(e)}")
+        finally:
+            TTS_QUEUE.task_done()
+
 def speak_text(text, lang):
     """
     Speaks translated text using Microsoft Speech API for better language support,
-    especially for Hindi
+    especially for Hindi. The audio is queued behind any chunk still playing and
+    the call returns without waiting for playback to finish.
     """
     if not text:
         logger.warning("No text to speak")
@@ -196,13 +608,9 @@ def speak_text(text, lang):
         
     logger.info(f"Speaking in {lang}: '{text}'")
     
-    # Create temporary wav file
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-    temp_filename = temp_file.name
-    temp_file.close()
-    
     # Try methods in order of preference
     tts_success = False
+    audio = None  # (pcm, samplerate, channels)
     
     # 1. Try Microsoft Speech API for all languages, especially Hindi
     if not tts_success:
@@ -210,9 +618,10 @@ def speak_text(text, lang):
             logger.info(f"Trying Microsoft Speech API for {lang}")
             
             # Use Microsoft Speech API
-            result = ms_speak(text, lang, temp_filename)
+            pcm = ms_speak(text, lang)
             
-            if result:
+            if pcm:
+                audio = (pcm, SAPI_SAMPLE_RATE, 1)
                 tts_success = True
                 logger.info("Microsoft Speech API TTS succeeded")
         except Exception as e:
@@ -222,13 +631,6 @@ def speak_text(text, lang):
     if not tts_success:
         try:
             logger.info(f"Trying eSpeak for {lang}")
-            import subprocess
-            
-            # Save text to a file first to avoid encoding issues
-            text_file = tempfile.NamedTemporaryFile(delete=False, mode='w', encoding='utf-8')
-            text_file.write(text)
-            text_file.close()
-            text_path = text_file.name
             
             # Map to specific eSpeak voices
             espeak_voice_map = {
@@ -242,86 +644,60 @@ def speak_text(text, lang):
             
             voice = espeak_voice_map.get(lang, "en")
             
-            # Extra parameters to improve speech quality
-            extra_params = ["-s", "130", "-p", "50"]
-            
-            # Build command using file input to avoid encoding issues
-            cmd = [ESPEAK_PATH, "-v", voice, "-w", temp_filename] + extra_params + ["-f", text_path]
-            
-            logger.info(f"Running eSpeak command: {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Clean up text file
-            os.unlink(text_path)
-            
-            if process.returncode != 0:
-                logger.error(f"eSpeak error: {process.stderr}")
-                raise Exception(f"eSpeak failed: {process.stderr}")
-            
-            # Check if file was created with content
-            if os.path.exists(temp_filename) and os.path.getsize(temp_filename) > 1000:
+            # Check if eSpeak produced audio
+            audio = espeak_synthesize(text, voice)
+            if len(audio[0]) > 1000:
                 tts_success = True
-                logger.info("eSpeak TTS saved to file successfully")
+                logger.info("eSpeak TTS synthesized successfully")
                 
         except Exception as e:
             logger.error(f"eSpeak error: {str(e)}")
     
     # 3. Fallback to pyttsx3 if others failed
-    if not tts_success:
+    if not tts_success and PYTTSX3_ENGINE is not None:
+        # pyttsx3 can only render to a file, so only this path needs a temp wav
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
+        temp_filename = temp_file.name
+        temp_file.close()
         try:
             logger.info(f"Trying pyttsx3 for language: {lang}")
-            engine = pyttsx3.init()
-            
-            # Adjust properties for better understandability
-            engine.setProperty('rate', 120)  # Slower speech rate
-            engine.setProperty('volume', 1.0)  # Maximum volume
             
-            # Try to set voice that matches language
-            for voice in engine.getProperty('voices'):
-                voice_id = voice.id.lower()
-                if lang in voice_id:
-                    logger.info(f"Found matching voice: {voice.id}")
-                    engine.setProperty('voice', voice.id)
-                    break
+            # Use the voice that matches language, else the engine default
+            voice_id = VOICE_MAP.get(lang)
+            if voice_id:
+                logger.info(f"Found matching voice: {voice_id}")
+            PYTTSX3_ENGINE.setProperty('voice', voice_id or PYTTSX3_DEFAULT_VOICE)
             
             # Save to file instead of direct playback
-            engine.save_to_file(text, temp_filename)
-            engine.runAndWait()
+            PYTTSX3_ENGINE.save_to_file(text, temp_filename)
+            PYTTSX3_ENGINE.runAndWait()
             
             # Check if file was created with content
             if os.path.exists(temp_filename) and os.path.getsize(temp_filename) > 1000:
+                with open(temp_filename, "rb") as f:
+                    audio = wav_to_pcm(f.read())
                 tts_success = True
                 logger.info("pyttsx3 TTS saved to file successfully")
         except Exception as e:
             logger.error(f"pyttsx3 error: {str(e)}")
+        finally:
+            # Clean up temporary file
+            try:
+                if os.path.exists(temp_filename):
+                    os.unlink(temp_filename)
+            except Exception as e:
+                logger.error(f"Cleanup error: {str(e)}")
     
     # If any TTS method succeeded, play the audio
     if tts_success:
         try:
-            # Play audio with pygame
-            pygame.mixer.init()
-            pygame.mixer.music.load(temp_filename)
-            pygame.mixer.music.play()
-            
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                import time
-                time.sleep(0.1)
-            
-            # Clean up
-            pygame.mixer.quit()
-            logger.info("Audio playback completed")
+            # Play raw PCM through sounddevice
+            play_audio(*audio)
+            logger.info("Audio queued for playback")
         except Exception as e:
             logger.error(f"Audio playback error: {str(e)}")
             tts_success = False
     
-    # Clean up temporary file
-    try:
-        if os.path.exists(temp_filename):
-            os.unlink(temp_filename)
-    except Exception as e:
-        logger.error(f"Cleanup error: {str(e)}")
-    
     # If all TTS methods failed, print the text as a last resort
     if not tts_success:
         print(f"\n===> [SPEECH ({lang})]: {text}\n")
@@ -329,10 +705,71 @@ def speak_text(text, lang):
     
     return tts_success
 
-def ms_speak(text, lang, output_file):
+def wav_to_pcm(data):
+    """Splits 16-bit WAV bytes into (pcm, samplerate, channels) for playback"""
+    with wave.open(io.BytesIO(data), "rb") as wav:
+        # The output stream is always int16
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"Unsupported WAV sample width: {wav.getsampwidth() * 8}-bit")
+        return wav.readframes(wav.getnframes()), wav.getframerate(), wav.getnchannels()
+
+def espeak_synthesize(text, voice):
+    """
+    Synthesizes text with eSpeak, passing the text on stdin and reading the
+    WAV from stdout so no temp files are needed. Returns (pcm, samplerate, channels).
+    """
+    # --stdin reads the whole input until EOF; -b 1 reads it as UTF-8
+    cmd = [ESPEAK_PATH, "-v", voice, "-b", "1", "-s", "130", "-p", "50", "--stdin", "--stdout"]
+    
+    logger.info(f"Running eSpeak command: {' '.join(cmd)}")
+    process = subprocess.run(cmd, input=text.encode("utf-8"), capture_output=True)
+    
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        logger.error(f"eSpeak error: {stderr}")
+        raise Exception(f"eSpeak failed: {stderr}")
+    
+    return wav_to_pcm(process.stdout)
+
+def init_audio():
+    """Starts the playback thread, which keeps the output device open between utterances"""
+    global _playback_thread
+    with _playback_thread_lock:
+        if _playback_thread is None:
+            _playback_thread = threading.Thread(target=_playback_loop, daemon=True)
+            _playback_thread.start()
+
+def _playback_loop():
+    """Writes queued PCM to a shared output stream, reopening it only if the format changes"""
+    stream = None
+    while True:
+        pcm, samplerate, channels = PLAYBACK_QUEUE.get()
+        try:
+            if stream is None or (stream.samplerate, stream.channels) != (samplerate, channels):
+                if stream is not None:
+                    stream.close()
+                stream = sd.RawOutputStream(samplerate=samplerate, channels=channels, dtype="int16")
+                stream.start()
+            stream.write(pcm)
+        except Exception as e:
+            logger.error(f"Audio playback error: {str(e)}")
+        finally:
+            PLAYBACK_QUEUE.task_done()
+
+def play_audio(pcm, samplerate, channels=1):
+    """Queues 16-bit PCM behind the chunk currently playing for gapless output"""
+    init_audio()
+    PLAYBACK_QUEUE.put((pcm, samplerate, channels))
+
+def wait_for_playback():
+    """Blocks until all queued speech has been handed to the output device"""
+    PLAYBACK_QUEUE.join()
+
+def ms_speak(text, lang):
     """
     Uses Microsoft Speech API (SAPI) to generate speech for multiple languages
-    Especially good for Hindi and other languages
+    Especially good for Hindi and other languages. Returns 22kHz 16-bit mono
+    PCM, or None on failure.
     """
     try:
         import win32com.client
@@ -372,29 +809,33 @@ def ms_speak(text, lang, output_file):
         if not voice_found:
             logger.info(f"No specific SAPI voice found for {lang}, using default voice")
         
-        # Create file stream for output
-        stream = win32com.client.Dispatch("SAPI.SpFileStream")
-        stream.Open(output_file, 3)  # 3 = SSFMCreateForWrite
+        # Create in-memory stream for output
+        stream = win32com.client.Dispatch("SAPI.SpMemoryStream")
+        audio_format = win32com.client.Dispatch("SAPI.SpAudioFormat")
+        audio_format.Type = SAPI_FORMAT_TYPE
+        stream.Format = audio_format
         
-        # Set output to file
+        # Set output to memory
         old_output = speaker.AudioOutputStream
         speaker.AudioOutputStream = stream
         
         # Speak text
         speaker.Speak(text)
-        
-        # Close stream
-        stream.Close()
         speaker.AudioOutputStream = old_output
         
-        # Verify file was created
-        result = os.path.exists(output_file) and os.path.getsize(output_file) > 1000
+        # Verify audio was produced
+        pcm = bytes(stream.GetData())
+        result = len(pcm) > 1000
         logger.info(f"Microsoft Speech API result: {result}")
-        return result
+        return pcm if result else None
         
     except Exception as e:
         logger.error(f"Microsoft Speech API error: {str(e)}")
-        return False
+        return None
+
+# Start the TTS thread at import so the pyttsx3 voice scan is ready for
+# /check_models however the app is served
+init_tts()
 
 @app.route("/")
 def index():
@@ -411,40 +852,28 @@ def translate():
 
         logger.info(f"Translating from {source} ({source_code}) to {target} ({target_code})")
 
-        # Check if model exists
-        model_path = MODEL_PATHS[source_code]
-        if not os.path.exists(model_path):
-            error_msg = f"Model for {source} not found at {model_path}!"
+        # Look up preloaded speech recognition model
+        model = MODELS.get(source_code)
+        if model is None:
+            error_msg = f"Model for {source} not loaded (expected at {MODEL_PATHS[source_code]})!"
             logger.error(error_msg)
-            return jsonify({"error": error_msg})
+            return jsonify({"error": error_msg}), 503
 
-        # Load speech recognition model
-        try:
-            model = vosk.Model(model_path)
-            logger.info(f"Successfully loaded model from {model_path}")
-        except Exception as e:
-            error_msg = f"Failed to create model: {str(e)}"
-            logger.error(error_msg)
-            return jsonify({"error": error_msg})
+        recognizer = vosk.KaldiRecognizer(model, SAMPLE_RATE)
 
-        # Recognize speech
-        recognizer = vosk.KaldiRecognizer(model, 16000)
-        recognized = recognize_speech(recognizer)
-        logger.info(f"Recognized text: '{recognized}'")
-
-        # Check if translation is available
-        can_translate = False
-        
         # Validate language models are available
         if source_code in lang_dict and target_code in lang_dict:
+            transcript = []
             try:
-                # Translate text
-                translated = translate_text(recognized, source_code, target_code)
+                # Recognize and translate as overlapping stages; speech continues in the background
+                translations = asyncio.run(
+                    run_pipeline(recognizer, source_code, target_code, transcript)
+                )
+                recognized = " ".join(transcript)
+                translated = join_segments(translations, target_code)
+                logger.info(f"Recognized text: '{recognized}'")
                 logger.info(f"Translated text: '{translated}'")
                 
-                # Speak translated text
-                speak_text(translated, target_code)
-                
                 return jsonify({
                     "recognized": recognized, 
                     "translated": translated
@@ -455,10 +884,17 @@ def translate():
                 logger.error(error_msg)
                 return jsonify({
                     "error": error_msg,
-                    "recognized": recognized,
+                    "recognized": " ".join(transcript),
                     "can_translate": False
                 })
         else:
+            # Recognize speech so the client still gets a transcript
+            prepare_capture()
+            recognized = " ".join(
+                frame["final"] for frame in recognize_speech(recognizer) if "final" in frame
+            )
+            logger.info(f"Recognized text: '{recognized}'")
+
             missing_models = []
             if source_code not in lang_dict:
                 missing_models.append(f"{source} ({source_code})")
@@ -479,6 +915,85 @@ def translate():
         logger.error(error_msg)
         return jsonify({"error": error_msg})
 
+@app.route("/translate_stream", methods=["GET"])
+def translate_stream():
+    """
+    Streaming variant of /translate for EventSource clients: partial
+    transcripts, recognized chunks and translations are sent as Server-Sent
+    Events while the user is still speaking. The stream ends with a "close"
+    event; clients should call close() on it so EventSource does not
+    reconnect and start another recording.
+    """
+    source = request.args.get("source")
+    target = request.args.get("target")
+    if source not in LANGUAGES or target not in LANGUAGES:
+        return jsonify({"error": f"Unsupported language pair: {source} -> {target}"}), 400
+    source_code = LANGUAGES[source]
+    target_code = LANGUAGES[target]
+
+    model = MODELS.get(source_code)
+    if model is None:
+        error_msg = f"Model for {source} not loaded (expected at {MODEL_PATHS[source_code]})!"
+        logger.error(error_msg)
+        return jsonify({"error": error_msg}), 503
+
+    missing_models = [
+        f"{name} ({code})" for name, code in ((source, source_code), (target, target_code))
+        if code not in lang_dict
+    ]
+    if missing_models:
+        error_msg = f"Missing translation models for: {', '.join(missing_models)}"
+        logger.error(error_msg)
+        return jsonify({"error": error_msg, "missing_models": missing_models}), 503
+
+    recognizer = vosk.KaldiRecognizer(model, SAMPLE_RATE)
+    events = queue.Queue()
+
+    def run():
+        transcript = []
+        try:
+            translations = asyncio.run(
+                run_pipeline(recognizer, source_code, target_code, transcript, events)
+            )
+            events.put({
+                "done": True,
+                "recognized": " ".join(transcript),
+                "translated": join_segments(translations, target_code)
+            })
+        except Exception as e:
+            logger.error(f"Error in streaming translation: {str(e)}")
+            events.put({"error": str(e)})
+        finally:
+            events.put(None)
+
+    threading.Thread(target=run, daemon=True).start()
+
+    def generate():
+        while True:
+            event = events.get()
+            if event is None:
+                break
+            yield f"data: {json.dumps(event)}\n\n"
+        # Ask the client to stop; the long retry covers clients that ignore it
+        yield "retry: 86400000\nevent: close\ndata: {}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream")
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """API route reporting rolling p50/p95/p99 latency (ms) for each pipeline stage"""
+    summary = {}
+    for stage, samples in LATENCIES.items():
+        data = list(samples)
+        if len(data) >= 2:
+            cuts = statistics.quantiles(data, n=100, method="inclusive")
+            summary[stage] = {"count": len(data), "p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+        elif data:
+            summary[stage] = {"count": 1, "p50": data[0], "p95": data[0], "p99": data[0]}
+        else:
+            summary[stage] = {"count": 0}
+    return jsonify(summary)
+
 @app.route("/check_models", methods=["GET"])
 def check_models():
     """API route to check available models and translations"""
@@ -487,66 +1002,37 @@ def check_models():
     # Check speech recognition models
     for lang_code, path in MODEL_PATHS.items():
         available_models[lang_code] = {
-            "speech_recognition": os.path.exists(path),
+            "speech_recognition": lang_code in MODELS,
             "path": path
         }
     
-    # Check translation capabilities
+    # Check translation capabilities against the table built at startup
     translation_capabilities = {}
     for source in LANGUAGES.values():
         for target in LANGUAGES.values():
             if source != target:
-                source_available = source in lang_dict
-                target_available = target in lang_dict
-                can_translate = False
-                
-                if source_available and target_available:
-                    try:
-                        translation = lang_dict[source].get_translation(lang_dict[target])
-                        can_translate = True
-                    except:
-                        can_translate = False
-                        
                 key = f"{source}-{target}"
                 translation_capabilities[key] = {
-                    "source_available": source_available,
-                    "target_available": target_available,
-                    "can_translate": can_translate
+                    "source_available": source in lang_dict,
+                    "target_available": target in lang_dict,
+                    "can_translate": (source, target) in TRANSLATION_TABLE or (source, target) in EN_PIVOT
                 }
     
-    # Check TTS capabilities
+    # Check TTS capabilities from the eSpeak check and pyttsx3 voice scan done at startup
+    if not PYTTSX3_READY.wait(timeout=5):
+        logger.warning("pyttsx3 voice scan still running; reporting no pyttsx3 voices")
     tts_capabilities = {}
-    
-    # Check eSpeak availability with hardcoded path
-    espeak_available = os.path.exists(ESPEAK_PATH)
-    
-    # Also check pyttsx3 voices as backup
-    try:
-        engine = pyttsx3.init()
-        voices = engine.getProperty('voices')
-        
-        for lang_code in LANGUAGES.values():
-            # Check for direct match in voice ID
-            voice_found = any(lang_code in voice.id.lower() for voice in voices)
-            
-            tts_capabilities[lang_code] = {
-                "espeak": espeak_available,
-                "pyttsx3": voice_found,
-            }
-    except Exception as e:
-        logger.error(f"Error checking TTS capabilities: {str(e)}")
-        # Fallback
-        for lang_code in LANGUAGES.values():
-            tts_capabilities[lang_code] = {
-                "espeak": espeak_available,
-                "pyttsx3": False
-            }
+    for lang_code in LANGUAGES.values():
+        tts_capabilities[lang_code] = {
+            "espeak": ESPEAK_AVAILABLE,
+            "pyttsx3": VOICE_MAP.get(lang_code) is not None,
+        }
     
     return jsonify({
         "speech_recognition_models": available_models,
         "translation_capabilities": translation_capabilities,
         "tts_capabilities": tts_capabilities,
-        "espeak_installed": espeak_available,
+        "espeak_installed": ESPEAK_AVAILABLE,
         "espeak_path": ESPEAK_PATH
     })
 
@@ -554,8 +1040,6 @@ def check_models():
 def check_espeak():
     """Check if eSpeak is installed and working using hardcoded path"""
     try:
-        import os.path
-        
         if not os.path.exists(ESPEAK_PATH):
             return jsonify({
                 "installed": False,
@@ -563,7 +1047,6 @@ def check_espeak():
             })
         
         # Test eSpeak by generating a simple message
-        import subprocess
         test_message = "eSpeak test successful"
         
         # Run eSpeak with version flag
@@ -635,7 +1118,7 @@ if __name__ == "__main__":
     logger.info(f"Available speech models: {[path for path in MODEL_PATHS.values() if os.path.exists(path)]}")
     
     # Check if eSpeak is installed using hardcoded path
-    if os.path.exists(ESPEAK_PATH):
+    if ESPEAK_AVAILABLE:
         logger.info(f"eSpeak found at: {ESPEAK_PATH}")
         logger.info("eSpeak is installed - offline TTS should work for all languages")
     else:
@@ -643,8 +1126,8 @@ if __name__ == "__main__":
         logger.warning("Offline TTS may not work properly!")
         logger.warning(f"Please make sure eSpeak is installed at {ESPEAK_PATH}")
     
-    # Initialize pygame for audio playback
-    pygame.init()
+    # Start the playback thread so the audio device is opened once for all playback
+    init_audio()
     
     # Run the Flask app
     app.run(debug=False, host='0.0.0.0', port=5000)
\ No newline at end of file